@@ -8,11 +8,153 @@ A transparent, always-on-top teleprompter that's invisible to screen capture sof
 
 import sys
 import os
+import time
+from functools import lru_cache
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
-                            QHBoxLayout, QPushButton, QTextEdit, QLabel, 
+                            QHBoxLayout, QPushButton, QPlainTextEdit, QLabel, 
                             QSlider, QComboBox, QColorDialog, QShortcut, QFrame, QSizeGrip)
-from PyQt5.QtCore import Qt, QTimer, QPoint
-from PyQt5.QtGui import QFont, QColor, QKeySequence, QPalette, QFontDatabase
+from PyQt5.QtCore import Qt, QTimer, QPoint, QSize, QRect, QEvent
+from PyQt5.QtGui import (QFont, QColor, QKeySequence, QPalette, QFontDatabase,
+                         QFontMetrics, QPainter, QPixmap, QIcon, QGuiApplication)
+
+# Pixels scrolled per second for each unit of scroll speed
+PIXELS_PER_SECOND = 20
+# Refresh rate used when the screen does not report one
+DEFAULT_REFRESH_RATE = 60.0
+
+# Keyboard shortcuts, built from key codes to skip the string parser
+SEQ_LOCK = QKeySequence(Qt.CTRL | Qt.Key_L)
+SEQ_SCROLL = QKeySequence(Qt.CTRL | Qt.Key_S)
+SEQ_COLOR = QKeySequence(Qt.CTRL | Qt.Key_C)
+SEQ_SPEED_UP = QKeySequence(Qt.CTRL | Qt.Key_Up)
+SEQ_SPEED_DOWN = QKeySequence(Qt.CTRL | Qt.Key_Down)
+SEQ_SCROLL_UP = QKeySequence(Qt.SHIFT | Qt.Key_Up)
+SEQ_SCROLL_DOWN = QKeySequence(Qt.SHIFT | Qt.Key_Down)
+SEQ_HIDE_CONTROLS = QKeySequence(Qt.CTRL | Qt.Key_H)
+SEQ_EMERGENCY_UNLOCK = QKeySequence(Qt.CTRL | Qt.ALT | Qt.Key_U)
+
+# Look of the whole application, applied once in main() instead of per widget.
+# Everything in the central widget is transparent unless a more specific
+# rule below says otherwise.
+APP_STYLESHEET = """
+    #centralWidget, #centralWidget * {
+        background-color: rgba(0, 0, 0, 0);
+    }
+    #controlPanel, #controlPanel QFrame {
+        background-color: rgba(40, 40, 40, 0.8);
+        border-radius: 10px;
+        padding: 5px;
+    }
+    #controlPanel QPushButton {
+        background-color: rgba(60, 60, 60, 0.8);
+        color: white;
+        border-radius: 5px;
+        padding: 5px;
+        min-height: 25px;
+    }
+    #controlPanel QPushButton:hover {
+        background-color: rgba(80, 80, 80, 0.9);
+    }
+    #controlPanel QPushButton#colorButton {
+        min-width: 30px;
+        min-height: 20px;
+        border-radius: 3px;
+    }
+    #controlPanel QLabel {
+        color: white;
+    }
+    #controlPanel QComboBox, #controlPanel QSlider {
+        background-color: rgba(60, 60, 60, 0.8);
+        color: white;
+        border-radius: 5px;
+    }
+    #centralWidget QPlainTextEdit {
+        background-color: rgba(20, 20, 20, 0.3);
+        border: 1px solid rgba(100, 100, 100, 0.5);
+        border-radius: 5px;
+        padding: 5px;
+    }
+    #centralWidget QSizeGrip {
+        background-color: rgba(40, 40, 40, 0.8);
+        border-radius: 5px;
+    }
+"""
+
+
+@lru_cache(maxsize=256)
+def _cached_font(family, size):
+    return QFont(family, size)
+
+
+def make_font(family, size):
+    """Return a QFont for family/size, resolving each pair only once"""
+    # Hand out a copy so callers can't mutate the cached instance
+    return QFont(_cached_font(family, size))
+
+class PromptTextEdit(QPlainTextEdit):
+    """Plain text edit that draws its placeholder from a cached pixmap"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._placeholder = ""
+        self._placeholder_pixmap = None
+        self._placeholder_width = 0
+
+    def placeholderText(self):
+        return self._placeholder
+
+    def setPlaceholderText(self, text):
+        # Kept out of QPlainTextEdit, which would re-shape it on every paint
+        self._placeholder = text
+        self._placeholder_pixmap = None
+        self.viewport().update()
+
+    def changeEvent(self, event):
+        # The pixmap depends on the font and the placeholder color
+        if event.type() in (QEvent.FontChange, QEvent.PaletteChange):
+            self._placeholder_pixmap = None
+        super().changeEvent(event)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        # The placeholder wraps to the viewport width
+        if self._placeholder_text_width() != self._placeholder_width:
+            self._placeholder_pixmap = None
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self._placeholder or not self.document().isEmpty():
+            return
+        if self._placeholder_pixmap is None:
+            self._placeholder_pixmap = self._render_placeholder()
+        offset = self.contentOffset()
+        margin = self.document().documentMargin()
+        painter = QPainter(self.viewport())
+        painter.drawPixmap(QPoint(int(offset.x() + margin), int(offset.y() + margin)),
+                           self._placeholder_pixmap)
+        painter.end()
+
+    def _placeholder_text_width(self):
+        margin = self.document().documentMargin()
+        return max(1, int(self.viewport().width() - 2 * margin))
+
+    def _render_placeholder(self):
+        # Word-wrapped to the viewport, like QPlainTextEdit's own placeholder
+        self._placeholder_width = self._placeholder_text_width()
+        rect = QFontMetrics(self.font()).boundingRect(
+            QRect(0, 0, self._placeholder_width, 0), Qt.TextWordWrap, self._placeholder)
+        rect = QRect(0, 0, self._placeholder_width, max(1, rect.height()))
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(rect.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setFont(self.font())
+        painter.setPen(self.palette().color(QPalette.PlaceholderText))
+        painter.drawText(rect, Qt.TextWordWrap, self._placeholder)
+        painter.end()
+        return pixmap
+
 
 class TeleprompterWindow(QMainWindow):
     def __init__(self):
@@ -41,31 +183,57 @@ class TeleprompterWindow(QMainWindow):
         self.font_family = "Arial"
         self.dragging = False
         self.drag_position = None
+        self.resizing = False
+        self.resize_start_pos = QPoint()
+        self.resize_start_size = QSize()
+        self._cursor_in_resize = False
+        
+        # Slider changes are applied after a short delay, so that dragging a
+        # slider only relayouts the text / resyncs the compositor once. One
+        # timer serves all sliders, so changes made together apply together.
+        self._pending_size = self.font_size
+        self._pending_transparency = self.transparency
+        self._settings_apply = QTimer(self, singleShot=True, interval=16)
+        self._settings_apply.timeout.connect(self._apply_pending_settings)
+        
         # Initialize UI
         self.init_ui()
         
         # Setup shortcuts
         self.setup_shortcuts()
         
+        # Keys handled by the event filter while locked, keyed by the
+        # combined key code. Sempre permitem destravar e start/stop scroll
+        self._key_map_locked = {
+            SEQ_LOCK[0]: self.toggle_lock,
+            SEQ_SCROLL[0]: self.toggle_scrolling,
+        }
+        
         # Create a special emergency unlock shortcut that always works
         # Using installEventFilter to ensure shortcuts work even when locked
         self.installEventFilter(self)
         
         # Create emergency unlock shortcut
-        self.emergency_unlock_shortcut = QShortcut(QKeySequence("Ctrl+Alt+U"), self)
+        self.emergency_unlock_shortcut = QShortcut(SEQ_EMERGENCY_UNLOCK, self)
         self.emergency_unlock_shortcut.activated.connect(self.emergency_unlock)
         
-        # Auto-scroll timer
+        # Auto-scroll timer, ticking once per display frame
         self.scroll_timer = QTimer()
+        self.scroll_timer.setTimerType(Qt.PreciseTimer)
         self.scroll_timer.timeout.connect(self.auto_scroll)
+        self._last_tick = 0.0
+        self._scroll_accum = 0.0
 
     def init_ui(self):
+        # No repaints while the widgets are being built
+        self.setUpdatesEnabled(False)
+        
         # Main container
         self.central_widget = QWidget()
         self.setCentralWidget(self.central_widget)
-        
-        # Set transparent background
-        self.central_widget.setStyleSheet("background-color: rgba(0, 0, 0, 0);")
+        self.central_widget.setObjectName("centralWidget")
+        # Fully transparent, so skip the system background fill
+        self.central_widget.setAttribute(Qt.WA_NoSystemBackground, True)
         
         # Main layout
         main_layout = QVBoxLayout(self.central_widget)
@@ -73,40 +241,14 @@ class TeleprompterWindow(QMainWindow):
         # Control panel (initially visible)
         self.control_panel = QFrame()
         self.control_panel.setFrameShape(QFrame.StyledPanel)
-        self.control_panel.setStyleSheet("""
-            QFrame {
-                background-color: rgba(40, 40, 40, 0.8);
-                border-radius: 10px;
-                padding: 5px;
-            }
-            QPushButton {
-                background-color: rgba(60, 60, 60, 0.8);
-                color: white;
-                border-radius: 5px;
-                padding: 5px;
-                min-height: 25px;
-            }
-            QPushButton:hover {
-                background-color: rgba(80, 80, 80, 0.9);
-            }
-            QLabel {
-                color: white;
-            }
-            QComboBox, QSlider {
-                background-color: rgba(60, 60, 60, 0.8);
-                color: white;
-                border-radius: 5px;
-            }
-        """)
+        self.control_panel.setObjectName("controlPanel")
         
         control_layout = QVBoxLayout(self.control_panel)
         
         # Font selection
         font_layout = QHBoxLayout()
         font_label = QLabel("Font:")
-        font_label.setStyleSheet("color: white;")
         self.font_combo = QComboBox()
-        self.load_fonts()
         self.font_combo.currentTextChanged.connect(self.change_font_family)
         font_layout.addWidget(font_label)
         font_layout.addWidget(self.font_combo)
@@ -115,7 +257,6 @@ class TeleprompterWindow(QMainWindow):
         # Font size
         size_layout = QHBoxLayout()
         size_label = QLabel("Size:")
-        size_label.setStyleSheet("color: white;")
         self.size_slider = QSlider(Qt.Horizontal)
         self.size_slider.setMinimum(8)
         self.size_slider.setMaximum(72)
@@ -128,10 +269,12 @@ class TeleprompterWindow(QMainWindow):
         # Font color
         color_layout = QHBoxLayout()
         color_label = QLabel("Font Color:")
-        color_label.setStyleSheet("color: white;")
         self.color_button = QPushButton("")
         self.color_button.setToolTip("Clique para mudar a cor da fonte (Ctrl+C)")
-        self.color_button.setStyleSheet(f"background-color: rgb({self.font_color.red()}, {self.font_color.green()}, {self.font_color.blue()}); min-width: 30px; min-height: 20px; border-radius: 3px;")
+        self.color_button.setObjectName("colorButton")
+        # Swatch icon, recolored by set_text_color
+        self._swatch_pix = QPixmap(30, 20)
+        self.color_button.setIconSize(self._swatch_pix.size())
         self.color_button.clicked.connect(self.change_font_color)
         color_layout.addWidget(color_label)
         color_layout.addWidget(self.color_button)
@@ -140,7 +283,6 @@ class TeleprompterWindow(QMainWindow):
         # Transparency
         trans_layout = QHBoxLayout()
         trans_label = QLabel("Transparency:")
-        trans_label.setStyleSheet("color: white;")
         self.trans_slider = QSlider(Qt.Horizontal)
         self.trans_slider.setMinimum(10)  # 10% minimum opacity
         self.trans_slider.setMaximum(100)  # 100% maximum opacity
@@ -153,7 +295,6 @@ class TeleprompterWindow(QMainWindow):
         # Scroll speed
         scroll_layout = QHBoxLayout()
         scroll_label = QLabel("Scroll Speed:")
-        scroll_label.setStyleSheet("color: white;")
         self.scroll_slider = QSlider(Qt.Horizontal)
         self.scroll_slider.setMinimum(1)
         self.scroll_slider.setMaximum(10)
@@ -177,19 +318,12 @@ class TeleprompterWindow(QMainWindow):
         control_layout.addLayout(button_layout)
         
         # Text edit area
-        self.text_edit = QTextEdit()
-        self.text_edit.setStyleSheet(f"""
-            QTextEdit {{
-                background-color: rgba(20, 20, 20, 0.3);
-                color: rgb({self.font_color.red()}, {self.font_color.green()}, {self.font_color.blue()});
-                border: 1px solid rgba(100, 100, 100, 0.5);
-                border-radius: 5px;
-                padding: 5px;
-            }}
-        """)
+        self.text_edit = PromptTextEdit()
+        # The text color is driven by the palette, see set_text_color
+        self.set_text_color(self.font_color)
         # Set placeholder text
         self.text_edit.setPlaceholderText("Digite ou cole seu texto aqui...")
-        self.text_edit.setFont(QFont(self.font_family, self.font_size))
+        self.text_edit.setFont(make_font(self.font_family, self.font_size))
         
         # Add widgets to main layout
         main_layout.addWidget(self.control_panel)
@@ -197,74 +331,73 @@ class TeleprompterWindow(QMainWindow):
         
         # Add size grip
         size_grip = QSizeGrip(self.central_widget)
-        size_grip.setStyleSheet("background-color: rgba(40, 40, 40, 0.8); border-radius: 5px;")
         main_layout.addWidget(size_grip, alignment=Qt.AlignBottom | Qt.AlignRight)
         
         # Set default size and position
         self.resize(600, 400)
         self.move(100, 100)
         
+        self.setUpdatesEnabled(True)
+        
         # Show the window
         self.show()
         
         # Set window opacity
         self.setWindowOpacity(self.transparency)
+        
+        # Enumerate system fonts once the window is already on screen
+        QTimer.singleShot(0, self.load_fonts)
 
     def load_fonts(self):
         """Load system fonts into the font combo box"""
         font_db = QFontDatabase()
-        for family in font_db.families():
-            self.font_combo.addItem(family)
+        # Populating the combo must not trigger change_font_family
+        self.font_combo.blockSignals(True)
+        self.font_combo.addItems(font_db.families())
         
         # Set default font
         index = self.font_combo.findText(self.font_family)
         if index >= 0:
             self.font_combo.setCurrentIndex(index)
+        self.font_combo.blockSignals(False)
 
     def setup_shortcuts(self):
         # Lock/unlock shortcut (Ctrl+L)
-        self.lock_shortcut = QShortcut(QKeySequence("Ctrl+L"), self)
+        self.lock_shortcut = QShortcut(SEQ_LOCK, self)
         self.lock_shortcut.activated.connect(self.toggle_lock)
         
         # Toggle scrolling (Ctrl+S)
-        self.scroll_shortcut = QShortcut(QKeySequence("Ctrl+S"), self)
+        self.scroll_shortcut = QShortcut(SEQ_SCROLL, self)
         self.scroll_shortcut.activated.connect(self.toggle_scrolling)
         
         # Font color shortcut (Ctrl+C)
-        self.color_shortcut = QShortcut(QKeySequence("Ctrl+C"), self)
+        self.color_shortcut = QShortcut(SEQ_COLOR, self)
         self.color_shortcut.activated.connect(self.change_font_color)
         
         # Increase scroll speed (Ctrl+Up)
-        self.speed_up_shortcut = QShortcut(QKeySequence("Ctrl+Up"), self)
+        self.speed_up_shortcut = QShortcut(SEQ_SPEED_UP, self)
         self.speed_up_shortcut.activated.connect(self.increase_scroll_speed)
         
         # Decrease scroll speed (Ctrl+Down)
-        self.speed_down_shortcut = QShortcut(QKeySequence("Ctrl+Down"), self)
+        self.speed_down_shortcut = QShortcut(SEQ_SPEED_DOWN, self)
         self.speed_down_shortcut.activated.connect(self.decrease_scroll_speed)
         
         # Manual scroll up (Shift+Up)
-        self.scroll_up_shortcut = QShortcut(QKeySequence("Shift+Up"), self)
+        self.scroll_up_shortcut = QShortcut(SEQ_SCROLL_UP, self)
         self.scroll_up_shortcut.activated.connect(self.scroll_up)
         
         # Manual scroll down (Shift+Down)
-        self.scroll_down_shortcut = QShortcut(QKeySequence("Shift+Down"), self)
+        self.scroll_down_shortcut = QShortcut(SEQ_SCROLL_DOWN, self)
         self.scroll_down_shortcut.activated.connect(self.scroll_down)
         
         # Toggle control panel visibility (Ctrl+H)
-        self.hide_controls_shortcut = QShortcut(QKeySequence("Ctrl+H"), self)
+        self.hide_controls_shortcut = QShortcut(SEQ_HIDE_CONTROLS, self)
         self.hide_controls_shortcut.activated.connect(self.toggle_controls)
 
     def toggle_lock(self):
         self.locked = not self.locked
         
         if self.locked:
-            # When locked, enable partial click-through but keep on top
-            self.setWindowFlags(
-                Qt.FramelessWindowHint | 
-                Qt.WindowStaysOnTopHint | 
-                Qt.Tool |
-                Qt.X11BypassWindowManagerHint
-            )
             self.lock_button.setText("Unlock Position")
             # Desabilitar controles e edição
             self.font_combo.setEnabled(False)
@@ -278,13 +411,6 @@ class TeleprompterWindow(QMainWindow):
             self.scroll_button.setEnabled(True)
             print("Teleprompter travado. Use Ctrl+Alt+U para destravar em caso de emergência.")
         else:
-            # When unlocked, disable click-through completamente
-            self.setWindowFlags(
-                Qt.FramelessWindowHint | 
-                Qt.WindowStaysOnTopHint | 
-                Qt.Tool |
-                Qt.X11BypassWindowManagerHint
-            )
             self.lock_button.setText("Lock Position")
             # Habilitar tudo de novo
             self.font_combo.setEnabled(True)
@@ -295,26 +421,47 @@ class TeleprompterWindow(QMainWindow):
             self.text_edit.setReadOnly(False)
             self.lock_button.setEnabled(True)
             self.scroll_button.setEnabled(True)
-        self.show()
-        self.activateWindow()
-        self.raise_()
 
     def toggle_scrolling(self):
         self.scrolling = not self.scrolling
         
         if self.scrolling:
-            # Start scrolling
-            self.scroll_timer.start(50)  # Update every 50ms
+            # Start scrolling, one tick per frame of the current screen
+            self._last_tick = time.perf_counter()
+            self._scroll_accum = 0.0
+            self.scroll_timer.start(int(1000 / self.refresh_rate()))
             self.scroll_button.setText("Stop Scrolling")
         else:
             # Stop scrolling
             self.scroll_timer.stop()
             self.scroll_button.setText("Start Scrolling")
 
+    def refresh_rate(self):
+        """Refresh rate of the screen the window is on, in Hz"""
+        handle = self.windowHandle()
+        screen = handle.screen() if handle else QApplication.primaryScreen()
+        rate = screen.refreshRate() if screen else 0
+        return rate if rate > 0 else DEFAULT_REFRESH_RATE
+
     def auto_scroll(self):
-        # Move the scroll bar down by the current scroll speed
+        # Move the scroll bar down proportionally to the elapsed time, so the
+        # speed does not depend on the refresh rate. Sub-pixel remainders are
+        # accumulated until they add up to a whole pixel.
+        now = time.perf_counter()
+        dt = now - self._last_tick
+        self._last_tick = now
         scrollbar = self.text_edit.verticalScrollBar()
-        scrollbar.setValue(scrollbar.value() + self.scroll_speed)
+        value = scrollbar.value()
+        if value >= scrollbar.maximum():
+            # Already at the end, nothing to repaint
+            self._scroll_accum = 0.0
+            return
+        self._scroll_accum += self.scroll_speed * dt * PIXELS_PER_SECOND
+        pixels = int(self._scroll_accum)
+        if not pixels:
+            return
+        self._scroll_accum -= pixels
+        scrollbar.setValue(value + pixels)
 
     def scroll_up(self):
         # Manual scroll up
@@ -341,18 +488,18 @@ class TeleprompterWindow(QMainWindow):
         self.scroll_speed = value
 
     def change_font_family(self, family):
-        # Update font family
+        # Update font family, skipping the relayout if nothing changed
+        if family == self.font_family:
+            return
         self.font_family = family
-        font = self.text_edit.font()
-        font.setFamily(family)
-        self.text_edit.setFont(font)
+        self.text_edit.setFont(make_font(self.font_family, self.font_size))
 
     def change_font_size(self, size):
-        # Update font size
-        self.font_size = size
-        font = self.text_edit.font()
-        font.setPointSize(size)
-        self.text_edit.setFont(font)
+        # Defer the font update until the slider settles
+        if size == self._pending_size:
+            return
+        self._pending_size = size
+        self._settings_apply.start()
 
     def change_font_color(self):
         # Open color dialog always on top and beside the main window
@@ -361,27 +508,40 @@ class TeleprompterWindow(QMainWindow):
         # Position dialog to the right of the main window
         geo = self.geometry()
         dialog.move(geo.x() + geo.width() + 10, geo.y())
+        # Live preview of the color being picked
+        dialog.currentColorChanged.connect(self.set_text_color)
         if dialog.exec_():
             color = dialog.selectedColor()
             if color.isValid():
                 self.font_color = color
-                # Update the color button to show the selected color
-                self.color_button.setStyleSheet(f"background-color: rgb({color.red()}, {color.green()}, {color.blue()}); min-width: 30px; min-height: 20px; border-radius: 3px;")
-                # Update the text edit color
-                self.text_edit.setStyleSheet(f"""
-                    QTextEdit {{
-                        background-color: rgba(20, 20, 20, 0.3);
-                        color: rgb({color.red()}, {color.green()}, {color.blue()});
-                        border: 1px solid rgba(100, 100, 100, 0.5);
-                        border-radius: 5px;
-                        padding: 5px;
-                    }}
-                """)
+        # Apply the final color, or restore the previous one if cancelled
+        self.set_text_color(self.font_color)
+
+    def set_text_color(self, color):
+        # Update the text edit color through its palette (no stylesheet reparse)
+        if not color.isValid():
+            return
+        palette = self.text_edit.palette()
+        palette.setColor(QPalette.Text, color)
+        self.text_edit.setPalette(palette)
+        # Update the color button to show the color
+        self._swatch_pix.fill(color)
+        self.color_button.setIcon(QIcon(self._swatch_pix))
 
     def change_transparency(self, value):
+        # Defer the opacity update until the slider settles
+        self._pending_transparency = value / 100.0
+        self._settings_apply.start()
+
+    def _apply_pending_settings(self):
+        # Update font size
+        if self._pending_size != self.font_size:
+            self.font_size = self._pending_size
+            self.text_edit.setFont(make_font(self.font_family, self.font_size))
         # Update window transparency
-        self.transparency = value / 100.0
-        self.setWindowOpacity(self.transparency)
+        if self._pending_transparency != self.transparency:
+            self.transparency = self._pending_transparency
+            self.setWindowOpacity(self.transparency)
 
     def toggle_controls(self):
         # Toggle visibility of control panel
@@ -393,35 +553,50 @@ class TeleprompterWindow(QMainWindow):
             self.toggle_lock()
 
 
+    def can_system_move_resize(self):
+        """Whether the window system can move/resize this window for us"""
+        # On X11 a window bypassing the window manager is never moved by it,
+        # yet startSystemMove()/startSystemResize() still report success
+        bypass_wm = bool(self.windowFlags() & Qt.X11BypassWindowManagerHint)
+        return not (bypass_wm and QGuiApplication.platformName() == "xcb")
+
     def mousePressEvent(self, event):
         # Check for resize operations in the corners and edges
         rect = self.rect()
         corner_size = 20
         
         # Bottom-right corner (resize)
-        if self.resize_enabled and rect.bottomRight().x() - event.x() < corner_size and rect.bottomRight().y() - event.y() < corner_size:
+        if self.resize_enabled and event.button() == Qt.LeftButton and rect.bottomRight().x() - event.x() < corner_size and rect.bottomRight().y() - event.y() < corner_size:
             self.setCursor(Qt.SizeFDiagCursor)
+            self._cursor_in_resize = True
             self.dragging = False
+            event.accept()
+            # Let the window system run the resize; fall back to resizing by
+            # hand when it can't
+            if self.can_system_move_resize() and self.windowHandle().startSystemResize(Qt.BottomEdge | Qt.RightEdge):
+                return
             self.resizing = True
             self.resize_start_pos = event.globalPos()
             self.resize_start_size = self.size()
-            event.accept()
             return
         
         # Allow clicking the lock button even when locked
-        if self.locked and self.lock_button.underMouse():
+        if self.locked and self.lock_button.rect().contains(self.lock_button.mapFromGlobal(event.globalPos())):
             self.toggle_lock()
             return
             
         if not self.locked and event.button() == Qt.LeftButton:
-            self.dragging = True
             self.resizing = False
-            self.drag_position = event.globalPos() - self.frameGeometry().topLeft()
             event.accept()
+            # Same for moving: prefer the window system, else drag by hand
+            if self.can_system_move_resize() and self.windowHandle().startSystemMove():
+                return
+            self.dragging = True
+            self.drag_position = event.globalPos() - self.frameGeometry().topLeft()
 
     def mouseMoveEvent(self, event):
         # Handle resizing
-        if self.resize_enabled and hasattr(self, 'resizing') and self.resizing and event.buttons() == Qt.LeftButton:
+        if self.resize_enabled and self.resizing and event.buttons() == Qt.LeftButton:
             diff = event.globalPos() - self.resize_start_pos
             new_width = max(self.minimumWidth(), self.resize_start_size.width() + diff.x())
             new_height = max(self.minimumHeight(), self.resize_start_size.height() + diff.y())
@@ -434,60 +609,41 @@ class TeleprompterWindow(QMainWindow):
             self.move(event.globalPos() - self.drag_position)
             event.accept()
             
-        # Show resize cursor when hovering over corner
+        # Show resize cursor when hovering over corner, only touching the
+        # cursor when entering or leaving the corner
         if self.resize_enabled:
             rect = self.rect()
             corner_size = 20
-            if rect.bottomRight().x() - event.x() < corner_size and rect.bottomRight().y() - event.y() < corner_size:
-                self.setCursor(Qt.SizeFDiagCursor)
-            else:
-                self.setCursor(Qt.ArrowCursor)
+            in_corner = rect.bottomRight().x() - event.x() < corner_size and rect.bottomRight().y() - event.y() < corner_size
+            if in_corner != self._cursor_in_resize:
+                self.setCursor(Qt.SizeFDiagCursor if in_corner else Qt.ArrowCursor)
+                self._cursor_in_resize = in_corner
 
     def mouseReleaseEvent(self, event):
         if event.button() == Qt.LeftButton:
             self.dragging = False
-            if hasattr(self, 'resizing'):
-                self.resizing = False
+            self.resizing = False
             event.accept()
 
     def eventFilter(self, obj, event):
         """Event filter to ensure shortcuts work even when locked"""
-        if event.type() == event.KeyPress:
-            # Sempre permitem destravar e start/stop scroll
-            if event.key() == Qt.Key_L and event.modifiers() == Qt.ControlModifier:
-                self.toggle_lock()
-                return True
-            elif event.key() == Qt.Key_S and event.modifiers() == Qt.ControlModifier:
-                self.toggle_scrolling()
-                return True
-            if self.locked:
-                # Bloquear todos os outros atalhos quando travado
-                return True
-            # Quando destravado, atalhos normais
-            if event.key() == Qt.Key_Up and event.modifiers() == Qt.ShiftModifier:
-                self.scroll_up()
-                return True
-            elif event.key() == Qt.Key_Down and event.modifiers() == Qt.ShiftModifier:
-                self.scroll_down()
-                return True
-            elif event.key() == Qt.Key_C and event.modifiers() == Qt.ControlModifier:
-                self.change_font_color()
-                return True
-            elif event.key() == Qt.Key_H and event.modifiers() == Qt.ControlModifier:
-                self.toggle_controls()
-                return True
-            elif event.key() == Qt.Key_Up and event.modifiers() == Qt.ControlModifier:
-                self.increase_scroll_speed()
-                return True
-            elif event.key() == Qt.Key_Down and event.modifiers() == Qt.ControlModifier:
-                self.decrease_scroll_speed()
-                return True
+        # Quando destravado, os QShortcuts cuidam de tudo
+        if self.locked and event.type() == event.KeyPress:
+            handler = self._key_map_locked.get(event.key() | int(event.modifiers()))
+            if handler:
+                handler()
+            # Bloquear todos os outros atalhos quando travado
+            return True
         return super().eventFilter(obj, event)
 
 def main():
+    # Must be set before the QApplication is created
+    QApplication.setAttribute(Qt.AA_UseDesktopOpenGL, True)
+    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
     app = QApplication(sys.argv)
     app.setApplicationName("Invisible Teleprompter")
     app.setOrganizationName("Teleprompter")
+    app.setStyleSheet(APP_STYLESHEET)
     
     # Create and show the teleprompter window
     teleprompter = TeleprompterWindow()